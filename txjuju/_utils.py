@@ -3,7 +3,10 @@
 import subprocess
 from collections import namedtuple
 
-import yaml
+try:
+    from yaml import CSafeLoader as _BaseYamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _BaseYamlLoader
 
 
 class Executable(namedtuple("Executable", "filename envvars")):
@@ -34,6 +37,11 @@ class Executable(namedtuple("Executable", "filename envvars")):
             return None
         return dict(envvars)
 
+    @property
+    def _env(self):
+        # subprocess never mutates env, so skip the defensive copy.
+        return super(Executable, self).envvars
+
     def resolve_args(self, *args):
         """Return the full args to pass to subprocess.*."""
         return [self.filename] + list(args)
@@ -44,7 +52,7 @@ class Executable(namedtuple("Executable", "filename envvars")):
         The provided kwargs are those that subprocess.* supports.
         """
         args = self.resolve_args(*args)
-        subprocess.check_call(args, env=self.envvars, **kwargs)
+        subprocess.check_call(args, env=self._env, **kwargs)
 
     def run_out(self, *args, **kwargs):
         """Return the output from running the executable with the given args.
@@ -52,10 +60,13 @@ class Executable(namedtuple("Executable", "filename envvars")):
         The provided kwargs are those that subprocess.* supports.
         """
         args = self.resolve_args(*args)
-        return subprocess.check_output(args, env=self.envvars, **kwargs)
+        return subprocess.check_output(args, env=self._env, **kwargs)
+
 
+class UnicodeYamlLoader(_BaseYamlLoader):
+    """yaml loader class returning unicode objects instead of python str.
 
-class UnicodeYamlLoader(yaml.Loader):
-    """yaml loader class returning unicode objects instead of python str."""
+    The libyaml-backed loader is used when PyYAML provides it.
+    """
 UnicodeYamlLoader.add_constructor(
     u'tag:yaml.org,2002:str', UnicodeYamlLoader.construct_scalar)
@@ -6,7 +6,9 @@ import shutil
 import tempfile
 import unittest
 
-from txjuju._utils import Executable
+import yaml
+
+from txjuju._utils import Executable, UnicodeYamlLoader
 
 
 class ExecutableTests(unittest.TestCase):
@@ -109,3 +111,23 @@ class ExecutableTests(unittest.TestCase):
 
         self.assertTrue(out.startswith("x -y z\n"))
         self.assertIn("SPAM=eggs\n", out)
+
+
+class UnicodeYamlLoaderTests(unittest.TestCase):
+
+    def test_strings_are_unicode(self):
+        """
+        UnicodeYamlLoader produces unicode objects for YAML strings.
+        """
+        data = yaml.load("spam: [eggs, 1]\nham: x", UnicodeYamlLoader)
+
+        self.assertEqual(data, {u"spam": [u"eggs", 1], u"ham": u"x"})
+        self.assertIsInstance(data.keys()[0], unicode)
+        self.assertIsInstance(data[u"spam"][0], unicode)
+
+    def test_safe(self):
+        """
+        UnicodeYamlLoader refuses to construct arbitrary python objects.
+        """
+        with self.assertRaises(yaml.constructor.ConstructorError):
+            yaml.load("!!python/object/apply:os.getcwd []", UnicodeYamlLoader)